@@ -1,10 +1,21 @@
-from typing import AsyncIterator, Dict, Generator, Iterator, List, Optional, Tuple
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from operator import itemgetter
+from types import MappingProxyType
 import asyncio
+import os
+import random
+import threading
 import time
 import warnings
+import weakref
 
+import cachetools
 import httpx
-import requests
 from .exceptions import AnytypeAPIError, AnytypeAuthError
 
 try:
@@ -16,14 +27,295 @@ except ImportError:
     from langchain.document_loaders.base import BaseLoader
     from langchain.schema import Document
 
+try:
+    # HTTP/2 support for httpx, installed with the ``http2`` extra.
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    # Faster JSON decoding, installed with the ``fast`` extra.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Typed decoding of listing pages, installed with the ``fast`` extra.
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    # Faster event loop, installed with the ``uvloop`` extra.
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Persistent response cache, installed with the ``cache`` extra.
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+_SCALAR_FORMATS = frozenset({"date", "text"})
+
+
+def _extract_tags(prop: Dict, extracted: Dict[str, object]) -> None:
+    items = prop.get("multi_select")
+    if not isinstance(items, list):
+        return
+    names = [str(tag["name"]) for tag in items if isinstance(tag, dict) and tag.get("name")]
+    if names:
+        extracted["tags"] = names
+
+
+def _extract_scalar(output_key: str, prop: Dict, extracted: Dict[str, object]) -> None:
+    fmt = prop.get("format")
+    # "format": "objects" is not supported for now
+    if fmt in _SCALAR_FORMATS:
+        extracted[output_key] = prop.get(fmt)
+
+
+# Object properties copied into document metadata, keyed by property key.
+_PROP_HANDLERS = {
+    "tag": _extract_tags,
+    "description": partial(_extract_scalar, "description"),
+    "created_date": partial(_extract_scalar, "created_at"),
+    "last_modified_date": partial(_extract_scalar, "updated_at"),
+    "last_opened_date": partial(_extract_scalar, "last_opened_at"),
+}
+_get_id = itemgetter("id")
+# Shared per-request headers for requests without a cached ETag.
+_NO_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+# Concurrent object fetches (and pooled connections) unless configured otherwise.
+_DEFAULT_CONCURRENCY = 32
+_CONCURRENCY_ENV = "ANYTYPE_LOADER_CONCURRENCY"
+
+# Seconds a fetched object is served from cache before it is revalidated.
+_OBJECT_CACHE_TTL = 600.0
+# Objects whose ETags are remembered unless configured otherwise.
+_DEFAULT_OBJECT_CACHE_SIZE = 4096
+
+# Transient statuses worth retrying, and the longest wait between attempts.
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 30.0
+
+if msgspec is not None:
+
+    class _ListedObject(msgspec.Struct):
+        id: str
+        archived: bool = False
+
+    class _Pagination(msgspec.Struct):
+        has_more: bool = False
+        next_cursor: Optional[str] = None
+        next_page_token: Optional[str] = None
+
+    class _ObjectsPage(msgspec.Struct):
+        # Only the fields read here are declared; msgspec skips everything else
+        # in the listing without building Python objects for it.
+        data: List[_ListedObject]
+        pagination: Optional[_Pagination] = None
+
+    class _ObjectType(msgspec.Struct):
+        name: Optional[str] = None
+
+    class _ObjectBody(msgspec.Struct):
+        # Blocks, icons and other large fields are skipped during decoding.
+        markdown: Optional[str] = None
+        name: Optional[str] = None
+        archived: bool = False
+        type: Optional[_ObjectType] = None
+        properties: Optional[List[Dict[str, Any]]] = None
+
+    class _ObjectResponse(msgspec.Struct):
+        object: _ObjectBody
+
+    _OBJECTS_PAGE_DECODER = msgspec.json.Decoder(_ObjectsPage)
+    _OBJECT_DECODER = msgspec.json.Decoder(_ObjectResponse)
+else:
+    _OBJECTS_PAGE_DECODER = None
+    _OBJECT_DECODER = None
+
+
+class _AdaptiveLimit:
+    """Bound on concurrent fetches that can shrink and grow while work is in flight.
+
+    Each rate-limited response lowers the limit by one (never below one); every
+    ``grow_after`` successful responses raise it by one, up to ``maximum``.
+    In-flight fetches are never interrupted; new ones wait for a free slot.
+    """
+
+    def __init__(self, maximum: int, grow_after: int = 20) -> None:
+        self.maximum = maximum
+        self.limit = maximum
+        self.grow_after = grow_after
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            # The limit may have grown since the last release; wake every free slot.
+            self._cond.notify(max(self.limit - self._in_flight, 1))
+
+    def rate_limited(self) -> None:
+        self.limit = max(self.limit - 1, 1)
+        self._successes = 0
+
+    def succeeded(self) -> None:
+        if self.limit >= self.maximum:
+            return
+        self._successes += 1
+        if self._successes >= self.grow_after:
+            self._successes = 0
+            self.limit += 1
+
+
+async def _anext(iterator: AsyncIterator):
+    """``anext()`` for Python < 3.10.
+
+    Starting the iteration inside a coroutine registers the generator with the
+    loop running it, so ``shutdown_asyncgens()`` can finish it.
+    """
+    return await iterator.__anext__()
+
+
+class _LoopThread:
+    """Event loop running in a daemon thread, with its own HTTP client.
+
+    Backs the sync API. Pooled connections are bound to the loop that opened
+    them, so ``client`` is never shared with the caller's event loop.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.client: Optional[httpx.AsyncClient] = None
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="anytype-loader", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro):
+        """Run ``coro`` on the loop and wait for its result."""
+        if self.loop.is_closed():
+            coro.close()
+            raise RuntimeError("The loader has been closed")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        if threading.current_thread() is self._thread:
+            # Dropped from a callback on the loop itself; it cannot wait for itself.
+            self.loop.call_soon(self.loop.stop)
+            return
+        self.run(self._shutdown())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    async def _shutdown(self) -> None:
+        # Finish open lazy_load() generators and their workers here, while the
+        # loop still runs, rather than leaving them to be collected later.
+        await self.loop.shutdown_asyncgens()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+
+# Limit of the fetch worker making the current request, if any.
+_current_limit: ContextVar[Optional[_AdaptiveLimit]] = ContextVar(
+    "anytype_loader_current_limit", default=None
+)
+
+
+class _ObjectMeta:
+    """Metadata of one fetched object, turned into a dict only for the Document."""
+
+    __slots__ = ("space_id", "space_name", "object_id", "name", "archived", "type", "properties")
+
+    def __init__(
+        self,
+        space_id: str,
+        space_name: Optional[str],
+        object_id: str,
+        name: str,
+        archived: bool,
+        type: str,
+        properties: Dict[str, object],
+    ) -> None:
+        self.space_id = space_id
+        self.space_name = space_name
+        self.object_id = object_id
+        self.name = name
+        self.archived = archived
+        self.type = type
+        self.properties = properties
+
+    def as_dict(self) -> Dict[str, object]:
+        metadata: Dict[str, object] = {
+            "space_id": self.space_id,
+            "space_name": self.space_name,
+            "object_id": self.object_id,
+            "id": self.object_id,
+            "name": self.name,
+            "archived": self.archived,
+            "type": self.type,
+        }
+        # Flattened properties, keyed by property key.
+        if self.properties:
+            metadata.update(self.properties)
+        return metadata
+
 
 class AnytypeLoader(BaseLoader):
     """Community loader for Anytype spaces.
 
     The loader pulls all objects from a given space, following pagination,
     then fetches each object's markdown content.
+
+    ``max_concurrency`` bounds the number of in-flight object fetches and also
+    sizes the async connection pool, so fetches never queue up waiting for a
+    free connection. It defaults to ``ANYTYPE_LOADER_CONCURRENCY`` when set,
+    else 32.
+
+    Archived objects are skipped as they are listed, before any fetch, unless
+    ``include_archived`` is set.
+
+    Fetched objects are revalidated with If-None-Match on every load, so edits
+    show up immediately while unchanged objects cost only a 304. With
+    ``revalidate=False``, objects fetched in the last 10 minutes are served
+    from cache without a request.
+    ETags are remembered for ``object_cache_size`` objects; set it above the
+    number of objects in the loaded spaces, or later loads download them all.
+
+    The sync API runs the same async pipeline on a private event loop in a
+    daemon thread, started on first use and stopped by ``close()``, ``aclose()``
+    or garbage collection of the loader.
     """
 
+    # Space listings shared by loaders in this process, keyed by (base_url, api_key).
+    _SPACES_CACHE: "cachetools.TTLCache[Tuple[str, str], List[Dict]]" = cachetools.TTLCache(
+        maxsize=64, ttl=300
+    )
+    _SPACES_CACHE_LOCK = threading.Lock()
+
     def __init__(
         self,
         url: str,
@@ -31,27 +323,107 @@ class AnytypeLoader(BaseLoader):
         space_names: List[str],
         page_size: int = 100,
         query: Optional[str] = None,
-        max_concurrency: int = 10,
+        max_concurrency: Optional[int] = None,
+        prefetch_pages: int = 2,
+        cache_dir: Optional[str] = None,
+        include_archived: bool = False,
+        revalidate: bool = True,
+        object_cache_size: int = _DEFAULT_OBJECT_CACHE_SIZE,
     ) -> None:
         if not url or not api_key:
             raise ValueError("url and api_key are required")
         if not space_names:
             raise ValueError("At least one space name is required")
+        if max_concurrency is None:
+            max_concurrency = self._default_concurrency()
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be at least 1")
+        if object_cache_size < 1:
+            raise ValueError("object_cache_size must be at least 1")
+        if cache_dir is not None and diskcache is None:
+            raise ImportError("cache_dir requires diskcache: pip install anytype-loader[cache]")
         self.base_url = url.rstrip("/")
+        self._object_url_tmpl = self.base_url + "/v1/spaces/{}/objects/{}"
         self.api_key = api_key
         self.page_size = page_size
         self.query = query
-        self.timeout = 30
+        self.include_archived = include_archived
+        self.revalidate = revalidate
+        # Fail fast on unreachable hosts and pool exhaustion, but leave reads
+        # enough time for large markdown bodies.
+        self.timeout = httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0)
+
+        # Default headers, built once and attached to both HTTP clients.
+        self._headers_cached: Mapping[str, str] = MappingProxyType(
+            {
+                "Accept": "application/json",
+                "User-Agent": "anytype-loader",
+                "Authorization": f"Bearer {self.api_key}",
+            }
+        )
+
+        # Listing responses keyed by request, stored as (etag, parsed result) and
+        # revalidated with If-None-Match. Optionally persisted across processes.
+        self._page_cache: Dict[Tuple, Tuple[str, object]] = {}
+        self._disk_cache = None
+        if cache_dir is not None:
+            self._disk_cache = diskcache.Cache(os.path.expanduser(cache_dir))
+        # Fetched objects keyed by (space_id, object_id), stored as (markdown, meta).
+        # Only read, and so only filled, with revalidate=False.
+        self._object_cache: "cachetools.TTLCache[Tuple[str, str], Optional[Tuple]]" = (
+            cachetools.TTLCache(maxsize=object_cache_size, ttl=_OBJECT_CACHE_TTL)
+        )
+        # ETags of fetched objects, kept past the TTL above so expired objects are
+        # revalidated with If-None-Match instead of downloaded again. Loads scan
+        # every object in order, so this must hold the whole space to be of use.
+        self._object_etags: "cachetools.LRUCache[Tuple[str, str], Tuple[str, Optional[Tuple]]]" = (
+            cachetools.LRUCache(maxsize=object_cache_size)
+        )
 
         # Async settings
         self.max_concurrency = max_concurrency
-        self.max_retries = 3
+        self.prefetch_pages = prefetch_pages
+        # Keyset pagination is used when the server hands out cursors; unknown
+        # until the first page with more results has been seen.
+        self._use_cursor: Optional[bool] = None
+        self.max_retries = 5
         self.retry_backoff = 1.0
         self._async_client = None
 
-        # Space info
+        # Sync settings: a private event loop thread, started on first sync use.
+        self._loop_runner: Optional[_LoopThread] = None
+        self._loop_finalizer: Optional[weakref.finalize] = None
+        self._loop_lock = threading.Lock()
+
+        # Space info. Resolving names is a one-off request, so the loop thread it
+        # needs is not kept around for callers that only use the async API.
         self.space_name_map: Dict[str, str] = {}
-        self.space_ids = self._resolve_space_ids(space_names)
+        try:
+            self.space_ids = self._resolve_space_ids(space_names)
+        finally:
+            self._stop_loop()
+
+    @staticmethod
+    def _default_concurrency() -> int:
+        value = os.environ.get(_CONCURRENCY_ENV)
+        if not value:
+            return _DEFAULT_CONCURRENCY
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"{_CONCURRENCY_ENV} must be an integer, got {value!r}") from None
+
+    @staticmethod
+    def install_uvloop() -> None:
+        """Make uvloop the event loop policy for loops created from now on.
+
+        Call once at startup, before ``asyncio.run``, for large async loads.
+        """
+        if uvloop is None:
+            raise ImportError("uvloop is not installed: pip install anytype-loader[uvloop]")
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     def _resolve_space_ids(
         self,
@@ -59,6 +431,9 @@ class AnytypeLoader(BaseLoader):
     ) -> List[str]:
         spaces = self._list_spaces()
         wanted = set(space_names)
+        if not wanted <= {space.get("name") for space in spaces if isinstance(space, dict)}:
+            # The shared listing may predate a space created since; check once more.
+            spaces = self._list_spaces(refresh=True)
 
         for space in spaces:
             if not isinstance(space, dict):
@@ -81,259 +456,684 @@ class AnytypeLoader(BaseLoader):
         return unique_ids
 
     def lazy_load(self) -> Iterator[Document]:
+        """Yield documents as their fetches complete, not in listing order."""
+        documents = self.alazy_load()
+        # The generator belongs to the loop it started on; closing the loader
+        # shuts it down there, and it must not be resumed on a later loop.
+        runner = self._get_loop_runner()
+        try:
+            while True:
+                try:
+                    yield runner.run(_anext(documents))
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not runner.loop.is_closed():
+                runner.run(documents.aclose())
+
+    def load_metadata_only(self) -> List[Dict[str, object]]:
+        """Return the metadata of every listed object without fetching its markdown.
+
+        Metadata is read from the listing rows, so this costs one request per
+        page rather than one per object. Useful to filter before loading.
+        """
+        return self._run(self.aload_metadata_only())
+
+    async def aload_metadata_only(self) -> List[Dict[str, object]]:
+        metadata: List[Dict[str, object]] = []
         for space_id in self.space_ids:
-            for object_id in self._iter_object_ids(space_id):
-                fetched = self._fetch_object(space_id, object_id)
-                if fetched is None:
+            async for row in self._aiter_object_rows(space_id):
+                object_id = row.get("id") if isinstance(row, dict) else None
+                if object_id is None:
+                    warnings.warn("Skipping listed objects without an id")
                     continue
-
-                markdown, metadata = fetched
-                yield Document(
-                    page_content=markdown,
-                    metadata=metadata,
-                )
+                if row.get("archived") is True and not self.include_archived:
+                    continue
+                metadata.append(self._meta_from_row(space_id, str(object_id), row).as_dict())
+        return metadata
+
+    def _run(self, coro):
+        """Run ``coro`` on the private event loop and wait for its result."""
+        return self._get_loop_runner().run(coro)
+
+    def _get_loop_runner(self) -> _LoopThread:
+        with self._loop_lock:
+            if self._loop_runner is None:
+                self._loop_runner = _LoopThread()
+                # Stop the thread even if the loader is dropped without close().
+                self._loop_finalizer = weakref.finalize(self, self._loop_runner.close)
+            return self._loop_runner
+
+    def _stop_loop(self) -> None:
+        with self._loop_lock:
+            finalizer, self._loop_finalizer = self._loop_finalizer, None
+            self._loop_runner = None
+        if finalizer is not None:
+            finalizer()
 
     async def alazy_load(self) -> AsyncIterator[Document]:
-        semaphore = asyncio.Semaphore(self.max_concurrency)
-
-        async def fetch_with_limit(space: str, oid: str):
-            async with semaphore:
-                return await self._afetch_object(space, oid)
-
-        tasks = []
-        for space_id in self.space_ids:
-            async for object_id in self._aiter_object_ids(space_id):
-                tasks.append(asyncio.create_task(fetch_with_limit(space_id, object_id)))
+        # On first use, open a pooled connection alongside the first listing request
+        # so the workers find a warm connection when the first page arrives.
+        warm_up = [asyncio.create_task(self._awarm_up())] if self._current_client() is None else []
+
+        # Object ids are listed by a producer task and fetched by a fixed pool of
+        # max_concurrency workers, so the number of live tasks does not grow with
+        # the number of objects. Fetches start as soon as the first page arrives.
+        # The workers share an adaptive limit that backs off when rate limited.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_concurrency)
+        results: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_concurrency)
+        limit = _AdaptiveLimit(self.max_concurrency)
+        producer = asyncio.create_task(self._aproduce_object_ids(queue))
+        workers = [
+            asyncio.create_task(self._afetch_worker(queue, results, limit))
+            for _ in range(self.max_concurrency)
+        ]
+        try:
+            active = len(workers)
+            while active:
+                item = await results.get()
+                if item is None:
+                    active -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    markdown, metadata = item
+                    yield Document(page_content=markdown, metadata=metadata.as_dict())
+
+            # Surface listing errors once the workers have drained the queue.
+            await producer
+        finally:
+            await self._cancel_tasks([*warm_up, producer, *workers])
+
+    async def _awarm_up(self) -> None:
+        """Issue a cheap request to resolve DNS and open a pooled connection."""
+        client = await self._get_client()
+        try:
+            await client.get(f"{self.base_url}/v1/spaces", params={"limit": 1})
+        except httpx.HTTPError:
+            # Real requests report connection problems with retries and context.
+            pass
 
-        for coro in asyncio.as_completed(tasks):
-            fetched = await coro
-            if fetched:
-                markdown, metadata = fetched
-                yield Document(page_content=markdown, metadata=metadata)
+    async def _afetch_worker(
+        self, queue: asyncio.Queue, results: asyncio.Queue, limit: _AdaptiveLimit
+    ) -> None:
+        """Fetch queued objects onto ``results`` until the sentinel, then push ``None``.
 
-    def _iter_object_ids(self, space_id: str) -> Generator[str, None, None]:
-        offset = 0
+        A failed fetch pushes the exception instead and stops the worker.
+        """
+        # Lets the retry loop report rate limiting for requests made by this task.
+        _current_limit.set(limit)
         while True:
-            object_ids, has_more = self._list_objects(
-                space_id=space_id, limit=self.page_size, offset=offset
-            )
-            if offset == 0 and not object_ids:
-                warnings.warn(f"No objects returned for space {space_id} (offset=0)")
-
-            for object_id in object_ids:
-                yield str(object_id)
-
-            offset += len(object_ids)
-
-            if not has_more:
+            item = await queue.get()
+            if item is None:
+                # Leave the sentinel in place for the other workers.
+                await queue.put(None)
                 break
+            space_id, object_id = item
+            try:
+                async with limit:
+                    fetched = await self._afetch_object(space_id, object_id)
+            except Exception as exc:
+                await results.put(exc)
+                return
+            if fetched is not None:
+                await results.put(fetched)
+        await results.put(None)
+
+    async def _aproduce_object_ids(self, queue: asyncio.Queue) -> None:
+        """Push ``(space_id, object_id)`` pairs onto ``queue``, then a ``None`` sentinel."""
+
+        async def produce(space_id: str) -> None:
+            async for object_id in self._aiter_object_ids(space_id):
+                await queue.put((space_id, object_id))
 
-    async def _aiter_object_ids(self, space_id: str) -> AsyncIterator[str]:
-        offset = 0
-        while True:
-            object_ids, has_more = await self._alist_objects(
-                space_id=space_id, limit=self.page_size, offset=offset
-            )
-            if offset == 0 and not object_ids:
-                warnings.warn(f"No objects returned for space {space_id} (offset=0)")
-
-            for object_id in object_ids:
-                yield str(object_id)
-
-            offset += len(object_ids)
-
-            if not has_more:
-                break
-
-    def _list_objects(self, space_id: str, limit: int, offset: int) -> Tuple[List[str], bool]:
-        endpoint = "search" if self.query else "objects"
-        url = f"{self.base_url}/v1/spaces/{space_id}/{endpoint}"
-
-        kwargs = {
-            "headers": self._headers(),
-            "params": {"limit": limit, "offset": offset},
-            "timeout": self.timeout,
-        }
+        # Spaces are listed concurrently, so the first page of one space does not
+        # wait for the pagination of the previous one.
+        tasks = [asyncio.create_task(produce(space_id)) for space_id in self.space_ids]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            await self._cancel_tasks(tasks)
+            # Wake the consumer so it can pick up the error from this task.
+            await queue.put(None)
+            raise
+        finally:
+            await self._cancel_tasks(tasks)
+        await queue.put(None)
 
-        if self.query:
-            kwargs["json"] = {"query": self.query}
-            response = self._request_with_retries("post", url, **kwargs)
-        else:
-            response = self._request_with_retries("get", url, **kwargs)
+    async def _aiter_object_ids(self, space_id: str) -> AsyncIterator[str]:
+        async for rows in self._aiter_pages(space_id, self._alist_objects):
+            for object_id, archived in rows:
+                if self.include_archived or not archived:
+                    yield object_id
+
+    async def _aiter_object_rows(self, space_id: str) -> AsyncIterator[Dict]:
+        """Yield the raw listing rows of a space."""
+        async for rows in self._aiter_pages(space_id, self._alist_object_rows):
+            for row in rows:
+                yield row
+
+    async def _aiter_pages(self, space_id: str, list_page) -> AsyncIterator[list]:
+        """Yield the non-empty listing pages of a space, in order.
+
+        ``list_page(space_id, limit, offset, cursor)`` returns
+        ``(rows, has_more, next_cursor)``; offsets count every returned row.
+        """
+        # Up to ``prefetch_pages`` listing requests are kept in flight, so the next
+        # page is usually ready by the time the current one has been handed out.
+        limit = self.page_size
+        next_offset = 0
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+
+        def schedule() -> None:
+            nonlocal next_offset
+            # Cursor pages depend on the previous response and cannot be prefetched.
+            depth = 1 if self._use_cursor else self.prefetch_pages
+            while len(pending) < depth:
+                task = asyncio.create_task(
+                    list_page(space_id=space_id, limit=limit, offset=next_offset)
+                )
+                pending.append((next_offset, task))
+                next_offset += limit
 
-        return self._parse_objects_response(response.json())
+        try:
+            schedule()
+            while pending:
+                offset, task = pending.popleft()
+                rows, has_more, next_cursor = await task
+                if offset == 0 and not rows:
+                    warnings.warn(f"No objects returned for space {space_id} (offset=0)")
+
+                # An empty page ends the listing even if it claims more, since
+                # the offset could not advance past it.
+                cursor = self._follow_cursor(next_cursor) if has_more and rows else None
+                if cursor is not None:
+                    await self._cancel_tasks([t for _, t in pending])
+                    pending.clear()
+                    next_offset = offset + len(rows)
+                    task = asyncio.create_task(
+                        list_page(space_id=space_id, limit=limit, offset=next_offset, cursor=cursor)
+                    )
+                    pending.append((next_offset, task))
+                    # Offset pages resume after this one if the server stops
+                    # handing out cursors.
+                    next_offset += limit
+                elif has_more and rows:
+                    if len(rows) != limit:
+                        # The server returned a short page; the speculative offsets are
+                        # off, so restart prefetching right after this page, spaced by
+                        # the page size the server is actually serving.
+                        await self._cancel_tasks([t for _, t in pending])
+                        pending.clear()
+                        limit = len(rows)
+                        next_offset = offset + len(rows)
+                    schedule()
+                else:
+                    await self._cancel_tasks([t for _, t in pending])
+                    pending.clear()
+
+                if rows:
+                    yield rows
+        finally:
+            await self._cancel_tasks([t for _, t in pending])
+
+    def _list_objects(
+        self, space_id: str, limit: int, offset: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, bool]], bool, Optional[str]]:
+        return self._run(self._alist_objects(space_id, limit, offset, cursor))
 
     async def _alist_objects(
-        self, space_id: str, limit: int, offset: int
-    ) -> Tuple[List[str], bool]:
-        client = await self._get_client()
-
+        self, space_id: str, limit: int, offset: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Tuple[str, bool]], bool, Optional[str]]:
+        # Search results are POSTed and never cached.
+        cache_key = None if self.query else ("object_rows", space_id, limit, offset, cursor)
+        headers = _NO_HEADERS if cache_key is None else self._conditional_headers(cache_key)
+        response = await self._arequest_objects_page(space_id, limit, offset, cursor, headers)
+        return self._read_objects_page(cache_key, response)
+
+    async def _arequest_objects_page(
+        self,
+        space_id: str,
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        headers: Mapping[str, str] = _NO_HEADERS,
+    ):
         endpoint = "search" if self.query else "objects"
         url = f"{self.base_url}/v1/spaces/{space_id}/{endpoint}"
-
-        kwargs = {
-            "headers": self._headers(),
-            "params": {"limit": limit, "offset": offset},
-            "timeout": self.timeout,
-        }
-
+        params = self._page_params(limit, offset, cursor)
         if self.query:
-            kwargs["json"] = {"query": self.query}
-            response = await self._arequest_with_retries(client.post, url, **kwargs)
-        else:
-            response = await self._arequest_with_retries(client.get, url, **kwargs)
-
-        return self._parse_objects_response(response.json())
-
-    def _list_spaces(self) -> List[Dict]:
-        """Fetch spaces to resolve names to ids."""
+            return await self._arequest_with_retries(
+                "post", url, params=params, json={"query": self.query}
+            )
+        return await self._arequest_with_retries("get", url, params=params, headers=headers)
+
+    async def _alist_object_rows(
+        self, space_id: str, limit: int, offset: int, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], bool, Optional[str]]:
+        response = await self._arequest_objects_page(space_id, limit, offset, cursor)
+        data = self._decode_json(response)
+        rows = data.get("data") if isinstance(data, dict) else None
+        if not isinstance(rows, list):
+            warnings.warn("Unexpected list response structure; treating as empty result")
+            return [], False, None
+
+        pagination_info = data.get("pagination")
+        has_more = isinstance(pagination_info, dict) and pagination_info.get("has_more") is True
+        return rows, has_more, self._parse_next_cursor(data)
+
+    def _read_objects_page(
+        self, cache_key: Optional[Tuple], response
+    ) -> Tuple[List[Tuple[str, bool]], bool, Optional[str]]:
+        cached = self._revalidated(cache_key, response)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+
+        result = self._decode_objects_page(response)
+        self._store_response(cache_key, response, result)
+        return result
+
+    def _decode_objects_page(self, response) -> Tuple[List[Tuple[str, bool]], bool, Optional[str]]:
+        if _OBJECTS_PAGE_DECODER is not None:
+            try:
+                page = _OBJECTS_PAGE_DECODER.decode(response.content)
+            except msgspec.DecodeError:
+                # Unexpected shape; the dict parser below handles and reports it.
+                pass
+            else:
+                pagination = page.pagination
+                rows = [(obj.id, obj.archived) for obj in page.data]
+                if pagination is None:
+                    return rows, False, None
+                cursor = pagination.next_cursor or pagination.next_page_token
+                return rows, pagination.has_more, cursor
+
+        data = self._decode_json(response)
+        rows, has_more = self._parse_objects_response(data)
+        return rows, has_more, self._parse_next_cursor(data)
+
+    def _list_spaces(self, refresh: bool = False) -> List[Dict]:
+        """Fetch spaces to resolve names to ids, reusing a recent listing unless ``refresh``."""
+        memo_key = (self.base_url, self.api_key)
+        if not refresh:
+            with self._SPACES_CACHE_LOCK:
+                spaces = self._SPACES_CACHE.get(memo_key)
+            if spaces is not None:
+                return spaces
+
+        spaces = self._run(self._arequest_spaces())
+        if spaces:
+            with self._SPACES_CACHE_LOCK:
+                self._SPACES_CACHE[memo_key] = spaces
+        return spaces
+
+    async def _arequest_spaces(self) -> List[Dict]:
         url = f"{self.base_url}/v1/spaces"
-        response = self._request_with_retries(
+        cache_key = ("spaces",)
+        response = await self._arequest_with_retries(
             "get",
             url,
-            headers=self._headers(),
+            headers=self._conditional_headers(cache_key),
             params={"limit": 100, "offset": 0},
-            timeout=self.timeout,
         )
-        data = response.json()
+        cached = self._revalidated(cache_key, response)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+
+        data = self._decode_json(response)
         spaces = data.get("data") if isinstance(data, dict) else None
         if isinstance(spaces, list):
+            self._store_response(cache_key, response, spaces)
             return spaces  # type: ignore[return-value]
         warnings.warn("Unexpected list spaces response structure; no spaces returned")
         return []
 
+    def _cached_response(self, cache_key: Tuple) -> Optional[Tuple[str, object]]:
+        entry = self._page_cache.get(cache_key)
+        if entry is None and self._disk_cache is not None:
+            entry = self._disk_cache.get((self.base_url, *cache_key))
+            if entry is not None:
+                self._page_cache[cache_key] = entry
+        return entry
+
+    def _conditional_headers(self, cache_key: Tuple) -> Mapping[str, str]:
+        entry = self._cached_response(cache_key)
+        return {"If-None-Match": entry[0]} if entry else _NO_HEADERS
+
+    def _revalidated(self, cache_key: Optional[Tuple], response) -> Optional[object]:
+        """Return the cached result when the server answered 304 Not Modified."""
+        if cache_key is None or response.status_code != 304:
+            return None
+        entry = self._cached_response(cache_key)
+        return entry[1] if entry else None
+
+    def _store_response(self, cache_key: Optional[Tuple], response, result: object) -> None:
+        etag = response.headers.get("ETag")
+        if cache_key is None or not etag:
+            return
+        self._page_cache[cache_key] = (etag, result)
+        if self._disk_cache is not None:
+            self._disk_cache.set((self.base_url, *cache_key), (etag, result))
+
+    @staticmethod
+    def _page_params(limit: int, offset: int, cursor: Optional[str]) -> Dict[str, object]:
+        if cursor is not None:
+            return {"limit": limit, "cursor": cursor}
+        return {"limit": limit, "offset": offset}
+
+    def _follow_cursor(self, next_cursor: Optional[str]) -> Optional[str]:
+        """Return the cursor for the next page, or None to keep paging by offset.
+
+        Whether the server paginates by cursor is decided once, from the first
+        page that reports more results.
+        """
+        if self._use_cursor is None:
+            self._use_cursor = next_cursor is not None
+        return next_cursor if self._use_cursor else None
+
+    @staticmethod
+    def _parse_next_cursor(data: object) -> Optional[str]:
+        pagination_info = data.get("pagination") if isinstance(data, dict) else None
+        if not isinstance(pagination_info, dict):
+            return None
+        cursor = pagination_info.get("next_cursor") or pagination_info.get("next_page_token")
+        return str(cursor) if cursor else None
+
     @staticmethod
-    def _parse_objects_response(data: object) -> Tuple[List[str], bool]:
+    def _parse_objects_response(data: object) -> Tuple[List[Tuple[str, bool]], bool]:
+        """Read the ``(object_id, archived)`` rows and has_more flag of a listing page."""
         if isinstance(data, dict):
             objects_section = data.get("data")
             pagination_info = data.get("pagination")
 
             if isinstance(objects_section, list):
-                ids: List[str] = []
-                for obj in objects_section:
-                    ids.append(obj["id"])
+                try:
+                    rows = [
+                        (str(_get_id(obj)), obj.get("archived") is True) for obj in objects_section
+                    ]
+                except (KeyError, TypeError, AttributeError):
+                    warnings.warn("Skipping listed objects without an id")
+                    rows = [
+                        (str(obj["id"]), obj.get("archived") is True)
+                        for obj in objects_section
+                        if isinstance(obj, dict) and "id" in obj
+                    ]
 
                 has_more = False
                 if isinstance(pagination_info, dict):
-                    has_more = bool(pagination_info.get("has_more"))
+                    has_more = pagination_info.get("has_more") is True
 
-                return ids, has_more
+                return rows, has_more
 
         warnings.warn("Unexpected list response structure; treating as empty result")
         return ([], False)
 
-    def _fetch_object(self, space_id: str, object_id: str) -> Optional[Tuple[str, Dict]]:
-        url = f"{self.base_url}/v1/spaces/{space_id}/objects/{object_id}"
-        response = self._request_with_retries("get", url, headers=self._headers(), timeout=30)
-        data = response.json()
+    def _fetch_object(self, space_id: str, object_id: str) -> Optional[Tuple[str, "_ObjectMeta"]]:
+        return self._run(self._afetch_object(space_id, object_id))
 
-        # Expected schema per docs: {"object": {...}}
-        obj = data.get("object") if isinstance(data, dict) else None
-
-        if not isinstance(obj, dict):
-            raise AnytypeAPIError(f"Malformed object response for {object_id}: {data}")
+    async def _afetch_object(
+        self, space_id: str, object_id: str
+    ) -> Optional[Tuple[str, "_ObjectMeta"]]:
+        cache_key = (space_id, object_id)
+        if self._load_cached_object(cache_key):
+            return self._object_cache[cache_key]
+        url = self._object_url_tmpl.format(space_id, object_id)
+        response = await self._arequest_with_retries(
+            "get", url, headers=self._object_conditional_headers(cache_key)
+        )
+        return self._read_object_response(cache_key, response)
+
+    def _load_cached_object(self, cache_key: Tuple[str, str]) -> bool:
+        """Whether ``cache_key`` can be served from cache without a request.
+
+        Only fresh entries with ``revalidate=False`` qualify. Otherwise cached
+        entries, including ones loaded from disk, only seed the ETag cache so
+        the fetch sends If-None-Match.
+        """
+        if not self.revalidate and cache_key in self._object_cache:
+            return True
+        if self._disk_cache is None or cache_key in self._object_etags:
+            return False
+        entry = self._disk_cache.get((self.base_url, "object", *cache_key))
+        if entry is None:
+            return False
+        try:
+            stored_at, etag, fetched = self._object_from_disk(cache_key, entry)
+        except (TypeError, ValueError):
+            # Written by another version of the loader; refetch it.
+            return False
+        if etag:
+            self._object_etags[cache_key] = (etag, fetched)
+        if self.revalidate or time.time() - stored_at >= _OBJECT_CACHE_TTL:
+            return False
+        self._object_cache[cache_key] = fetched
+        return True
+
+    def _object_conditional_headers(self, cache_key: Tuple[str, str]) -> Mapping[str, str]:
+        entry = self._object_etags.get(cache_key)
+        return {"If-None-Match": entry[0]} if entry else _NO_HEADERS
+
+    def _read_object_response(
+        self, cache_key: Tuple[str, str], response
+    ) -> Optional[Tuple[str, "_ObjectMeta"]]:
+        entry = self._object_etags.get(cache_key)
+        if response.status_code == 304 and entry is not None:
+            etag, fetched = entry
+        else:
+            fetched = self._decode_object_response(*cache_key, response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._object_etags[cache_key] = (etag, fetched)
+        if not self.revalidate:
+            self._object_cache[cache_key] = fetched
+        if self._disk_cache is not None:
+            self._disk_cache.set(
+                (self.base_url, "object", *cache_key), self._object_to_disk(etag, fetched)
+            )
+        return fetched
 
-        markdown = obj.get("markdown")
+    @staticmethod
+    def _object_to_disk(etag: Optional[str], fetched: Optional[Tuple[str, "_ObjectMeta"]]) -> Tuple:
+        """Flatten a fetched object into plain data for the persistent cache.
+
+        The space name is left out; it is looked up again when the entry is read.
+        """
+        if fetched is None:
+            return (time.time(), etag, None, None)
+        markdown, meta = fetched
+        return (time.time(), etag, markdown, (meta.name, meta.archived, meta.type, meta.properties))
+
+    def _object_from_disk(
+        self, cache_key: Tuple[str, str], entry: Tuple
+    ) -> Tuple[float, Optional[str], Optional[Tuple[str, "_ObjectMeta"]]]:
+        stored_at, etag, markdown, fields = entry
         if markdown is None:
-            warnings.warn(f"No markdown content for object {object_id}; skipping")
-            return None
-
-        obj_type = None
-        if isinstance(obj.get("type"), dict):
-            obj_type = obj["type"].get("name")
-        if obj_type is None:
-            warnings.warn(f"Missing type for object {object_id}; using 'unknown'")
-            obj_type = "unknown"
-
-        name = obj.get("name") or "untitled"
-        if obj.get("name") is None:
-            warnings.warn(f"Missing name for object {object_id}; using 'untitled'")
-
-        metadata: Dict = {
-            "space_id": space_id,
-            "space_name": self.space_name_map.get(space_id),
-            "object_id": object_id,
-            "id": object_id,
-            "name": name,
-            "archived": bool(obj.get("archived")),
-            "type": obj_type,
-        }
-
-        # Flatten properties into a dict keyed by property key.
-        properties: List[Dict] = obj.get("properties")
-        flattened_properties = self._extract_properties(properties)
-        if flattened_properties:
-            metadata.update(flattened_properties)
+            return float(stored_at), etag, None
+        name, archived, obj_type, properties = fields
+        space_id, object_id = cache_key
+        meta = _ObjectMeta(
+            space_id=space_id,
+            space_name=self.space_name_map.get(space_id),
+            object_id=object_id,
+            name=name,
+            archived=archived,
+            type=obj_type,
+            properties=dict(properties),
+        )
+        return float(stored_at), etag, (str(markdown), meta)
 
-        return str(markdown), metadata
+    def _decode_object_response(
+        self, space_id: str, object_id: str, response
+    ) -> Optional[Tuple[str, "_ObjectMeta"]]:
+        if _OBJECT_DECODER is not None:
+            try:
+                obj = _OBJECT_DECODER.decode(response.content).object
+            except msgspec.DecodeError:
+                # Unexpected shape; the dict parser below handles and reports it.
+                pass
+            else:
+                return self._build_object(
+                    space_id,
+                    object_id,
+                    markdown=obj.markdown,
+                    obj_type=obj.type.name if obj.type is not None else None,
+                    name=obj.name,
+                    archived=obj.archived,
+                    properties=obj.properties,
+                )
 
-    async def _afetch_object(self, space_id: str, object_id: str) -> Optional[Tuple[str, Dict]]:
-        url = f"{self.base_url}/v1/spaces/{space_id}/objects/{object_id}"
-
-        client = await self._get_client()
-        response = await self._arequest_with_retries(
-            client.get,
-            url,
-            headers=self._headers(),
-        )
-        data = response.json()
+        return self._parse_object_response(space_id, object_id, self._decode_json(response))
 
+    def _parse_object_response(
+        self, space_id: str, object_id: str, data: object
+    ) -> Optional[Tuple[str, "_ObjectMeta"]]:
+        # Expected schema per docs: {"object": {...}}
         obj = data.get("object") if isinstance(data, dict) else None
 
         if not isinstance(obj, dict):
             raise AnytypeAPIError(f"Malformed object response for {object_id}: {data}")
 
         markdown = obj.get("markdown")
+        if markdown is not None and not isinstance(markdown, str):
+            markdown = str(markdown)
+
+        return self._build_object(
+            space_id,
+            object_id,
+            markdown=markdown,
+            obj_type=self._type_name(obj),
+            name=obj.get("name"),
+            archived=bool(obj.get("archived")),
+            properties=obj.get("properties"),
+        )
+
+    def _build_object(
+        self,
+        space_id: str,
+        object_id: str,
+        markdown: Optional[str],
+        obj_type: Optional[str],
+        name: Optional[str],
+        archived: bool,
+        properties: Optional[List[Dict]],
+    ) -> Optional[Tuple[str, "_ObjectMeta"]]:
         if markdown is None:
             warnings.warn(f"No markdown content for object {object_id}; skipping")
             return None
 
-        obj_type = None
-        if isinstance(obj.get("type"), dict):
-            obj_type = obj["type"].get("name")
+        return markdown, self._build_meta(space_id, object_id, obj_type, name, archived, properties)
+
+    def _meta_from_row(self, space_id: str, object_id: str, obj: Dict) -> "_ObjectMeta":
+        return self._build_meta(
+            space_id,
+            object_id,
+            obj_type=self._type_name(obj),
+            name=obj.get("name"),
+            archived=bool(obj.get("archived")),
+            properties=obj.get("properties"),
+        )
+
+    @staticmethod
+    def _type_name(obj: Dict) -> Optional[str]:
+        obj_type = obj.get("type")
+        return obj_type.get("name") if isinstance(obj_type, dict) else None
+
+    def _build_meta(
+        self,
+        space_id: str,
+        object_id: str,
+        obj_type: Optional[str],
+        name: Optional[str],
+        archived: bool,
+        properties: Optional[List[Dict]],
+    ) -> "_ObjectMeta":
         if obj_type is None:
             warnings.warn(f"Missing type for object {object_id}; using 'unknown'")
             obj_type = "unknown"
 
-        name = obj.get("name") or "untitled"
-        if obj.get("name") is None:
+        if name is None:
             warnings.warn(f"Missing name for object {object_id}; using 'untitled'")
 
-        metadata: Dict = {
-            "space_id": space_id,
-            "space_name": self.space_name_map.get(space_id),
-            "object_id": object_id,
-            "id": object_id,
-            "name": name,
-            "archived": bool(obj.get("archived")),
-            "type": obj_type,
-        }
-
-        properties: List[Dict] = obj.get("properties")
-        flattened_properties = self._extract_properties(properties)
-        if flattened_properties:
-            metadata.update(flattened_properties)
-
-        return str(markdown), metadata
+        return _ObjectMeta(
+            space_id=space_id,
+            space_name=self.space_name_map.get(space_id),
+            object_id=object_id,
+            name=name or "untitled",
+            archived=archived,
+            type=obj_type,
+            properties=self._extract_properties(properties),
+        )
 
-    def _headers(self) -> Dict[str, str]:
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "anytype-loader",
+    def _client_options(self) -> Dict[str, object]:
+        # The pool leaves room beyond max_concurrency for prefetched listing pages
+        # and retries, so fetch workers never wait on a free connection; only
+        # max_concurrency idle connections are kept alive between requests.
+        return {
+            "http2": _HTTP2_AVAILABLE,
+            "timeout": self.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.max_concurrency * 2,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=60.0,
+            ),
+            "headers": self._headers_cached,
         }
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
 
-    async def _get_client(self):
-        if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=30)
+    def _current_client(self):
+        """The client opened for the running event loop, if any."""
+        runner = self._loop_runner
+        if runner is not None and asyncio.get_running_loop() is runner.loop:
+            return runner.client
         return self._async_client
 
+    async def _get_client(self):
+        client = self._current_client()
+        if client is None:
+            client = httpx.AsyncClient(**self._client_options())
+            runner = self._loop_runner
+            if runner is not None and asyncio.get_running_loop() is runner.loop:
+                runner.client = client
+            else:
+                self._async_client = client
+        return client
+
+    def clear_cache(self) -> None:
+        """Drop cached objects, listing pages and this loader's space listing.
+
+        A persistent ``cache_dir`` is left untouched.
+        """
+        self._object_cache.clear()
+        self._object_etags.clear()
+        self._page_cache.clear()
+        with self._SPACES_CACHE_LOCK:
+            self._SPACES_CACHE.pop((self.base_url, self.api_key), None)
+
+    def close(self):
+        self._stop_loop()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     async def aclose(self):
         if self._async_client:
             await self._async_client.aclose()
             self._async_client = None
+        if self._loop_runner is not None:
+            # Joining the loop thread blocks, so do it off this event loop.
+            await asyncio.get_running_loop().run_in_executor(None, self._stop_loop)
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    @staticmethod
+    async def _cancel_tasks(tasks: List[asyncio.Task]) -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def __aenter__(self):
         return self
@@ -347,83 +1147,95 @@ class AnytypeLoader(BaseLoader):
             return {}
 
         extracted: Dict[str, object] = {}
-        allowed_keys = {
-            "tag",
-            "description",
-            "last_opened_date",
-            "last_modified_date",
-            "created_date",
-        }
-        rename_map = {
-            "created_date": "created_at",
-            "last_modified_date": "updated_at",
-            "last_opened_date": "last_opened_at",
-        }
 
         for prop in properties:
-            key = prop.get("key")
-
-            if key not in allowed_keys:
-                continue
-
-            if key == "tag":
-                items = prop.get("multi_select")
-                if not isinstance(items, list):
-                    continue
-                names: List[str] = []
-                for tag in items:
-                    if isinstance(tag, dict) and tag.get("name"):
-                        names.append(str(tag["name"]))
-                if names:
-                    extracted["tags"] = names
-                continue
-
-            fmt = prop.get("format")
-            if fmt in ["date", "text"]:
-                if key in rename_map:
-                    key = rename_map[key]
-
-                extracted[key] = prop.get(fmt)
-
-            else:
-                # "format": "objects" is not supported for now
-                continue
+            handler = _PROP_HANDLERS.get(prop.get("key"))
+            if handler is not None:
+                handler(prop, extracted)
 
         return extracted
 
-    def _request_with_retries(self, method: str, url: str, **kwargs):
-        attempt = 0
-        while True:
-            try:
-                response = requests.request(method, url, **kwargs)
-            except requests.RequestException as exc:
-                raise AnytypeAPIError(f"Request to {url} failed: {exc}") from exc
-            if response.status_code in {429, 503} and attempt < self.max_retries:
-                warnings.warn(
-                    f"Rate limited ({response.status_code}); retrying {attempt + 1}/{self.max_retries}"
-                )
-                attempt += 1
-                time.sleep(self.retry_backoff * attempt)
-                continue
-            self._raise_for_status(response, url)
-            return response
-
-    async def _arequest_with_retries(self, func, url: str, **kwargs):
-        attempt = 0
+    async def _arequest_with_retries(self, method: str, url: str, **kwargs):
+        client = await self._get_client()
+        attempt, delay = 0, self.retry_backoff
         while True:
             try:
-                response = await func(url, **kwargs)
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as exc:
+                if not self._is_retryable(method, None, attempt):
+                    raise AnytypeAPIError(f"Request to {url} failed: {exc}") from exc
+                response, reason = None, type(exc).__name__
             except httpx.HTTPError as exc:
                 raise AnytypeAPIError(f"Request to {url} failed: {exc}") from exc
-            if response.status_code in {429, 503} and attempt < self.max_retries:
-                warnings.warn(
-                    f"Rate limited ({response.status_code}); retrying {attempt + 1}/{self.max_retries}"
-                )
-                attempt += 1
-                await asyncio.sleep(self.retry_backoff * attempt)
-                continue
-            self._raise_for_status(response, url)
-            return response
+            else:
+                limit = _current_limit.get()
+                if limit is not None:
+                    if response.status_code == 429:
+                        limit.rate_limited()
+                    elif response.status_code < 400:
+                        limit.succeeded()
+                if not self._is_retryable(method, response.status_code, attempt):
+                    self._raise_for_status(response, url)
+                    return response
+                reason = str(response.status_code)
+            attempt += 1
+            delay = self._retry_delay(delay, response)
+            warnings.warn(
+                f"Request to {url} failed ({reason}); "
+                f"retrying {attempt}/{self.max_retries} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _is_retryable(self, method: str, status_code: Optional[int], attempt: int) -> bool:
+        """Whether to retry after a transport error (``status_code=None``) or a status."""
+        if attempt >= self.max_retries:
+            return False
+        if status_code == 429:
+            # Rejected before processing, so safe to repeat for any method.
+            return True
+        if method.upper() == "POST":
+            return False
+        return status_code is None or status_code in _RETRY_STATUSES
+
+    def _retry_delay(self, previous: float, response=None) -> float:
+        """Seconds to wait before the next retry, given the ``previous`` delay.
+
+        Uses decorrelated jitter so concurrent requests that fail together do not
+        retry in lockstep, and never waits less than the server's Retry-After.
+        """
+        delay = min(
+            random.uniform(self.retry_backoff, max(previous * 3, self.retry_backoff)),
+            _MAX_RETRY_DELAY,
+        )
+        retry_after = self._parse_retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, _MAX_RETRY_DELAY))
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[float]:
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # A "-0000" zone parses as naive; HTTP dates are always UTC.
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    @staticmethod
+    def _decode_json(response) -> object:
+        if orjson is not None:
+            # Decode the raw bytes directly, skipping the intermediate str.
+            return orjson.loads(response.content)
+        return response.json()
 
     def _raise_for_status(self, response, url: str):
         if response.status_code < 400:
@@ -1,9 +1,15 @@
+import asyncio
+import gc
 import json
+import threading
 from pathlib import Path
+from typing import Optional
 
+import cachetools
 import pytest
 
-from anytype_loader.loader import AnytypeLoader
+from anytype_loader.exceptions import AnytypeAPIError
+from anytype_loader.loader import AnytypeLoader, _AdaptiveLimit, _ObjectMeta
 
 
 # Fixtures
@@ -13,20 +19,45 @@ def _load_fixture(name: str) -> dict:
 
 
 class _DummyResponse:
-    def __init__(self, payload: dict):
+    def __init__(self, payload: dict, status_code: int = 200, headers: Optional[dict] = None):
         self.payload = payload
-        self.status_code = 200
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self.payload
 
 
+def _rows(*object_ids: str) -> list:
+    return [(object_id, False) for object_id in object_ids]
+
+
+class _DummyClient:
+    def __init__(self, request):
+        self.request = request
+
+
 # Tests
 def test_init_requires_url_and_api_key():
     with pytest.raises(ValueError):
         AnytypeLoader(url="", api_key="", space_names=["personal"])
 
 
+def test_max_concurrency_defaults_from_environment(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    kwargs = {"url": "http://example.com", "api_key": "key", "space_names": ["Personal"]}
+
+    monkeypatch.delenv("ANYTYPE_LOADER_CONCURRENCY", raising=False)
+    assert AnytypeLoader(**kwargs).max_concurrency == 32
+
+    monkeypatch.setenv("ANYTYPE_LOADER_CONCURRENCY", "64")
+    assert AnytypeLoader(**kwargs).max_concurrency == 64
+    assert AnytypeLoader(max_concurrency=8, **kwargs).max_concurrency == 8
+
+
 def test_resolve_space_ids_maps_known_spaces(monkeypatch):
     spaces = [
         {"id": "space-1", "name": "Personal"},
@@ -48,7 +79,7 @@ def test_resolve_space_ids_warns_for_missing_spaces(monkeypatch):
     monkeypatch.setattr(
         AnytypeLoader,
         "_list_spaces",
-        lambda self: [{"id": "space-1", "name": "Personal"}],
+        lambda self, refresh=False: [{"id": "space-1", "name": "Personal"}],
     )
 
     with pytest.warns(UserWarning, match="Skipping unknown spaces: Work"):
@@ -61,6 +92,47 @@ def test_resolve_space_ids_warns_for_missing_spaces(monkeypatch):
     assert set(loader.space_ids) == {"space-1"}
 
 
+def test_list_spaces_is_shared_between_loaders(monkeypatch):
+    monkeypatch.setattr(AnytypeLoader, "_SPACES_CACHE", cachetools.TTLCache(maxsize=8, ttl=300))
+    calls = []
+
+    async def fake_arequest_spaces(self):
+        calls.append(self.base_url)
+        return [{"id": "space-1", "name": "Personal"}]
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_spaces", fake_arequest_spaces)
+
+    for _ in range(3):
+        AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    AnytypeLoader(url="http://other.example.com", api_key="key", space_names=["Personal"])
+
+    assert calls == ["http://example.com", "http://other.example.com"]
+
+
+def test_list_spaces_refetches_when_shared_listing_misses_a_name(monkeypatch):
+    monkeypatch.setattr(AnytypeLoader, "_SPACES_CACHE", cachetools.TTLCache(maxsize=8, ttl=300))
+    spaces = [{"id": "space-1", "name": "Personal"}]
+    calls = []
+
+    async def fake_arequest_spaces(self):
+        calls.append(self.base_url)
+        return list(spaces)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_spaces", fake_arequest_spaces)
+    kwargs = {"url": "http://example.com", "api_key": "key"}
+
+    AnytypeLoader(space_names=["Personal"], **kwargs)
+    # A space created after the listing was shared.
+    spaces.append({"id": "space-2", "name": "Work"})
+    loader = AnytypeLoader(space_names=["Work"], **kwargs)
+
+    assert list(loader.space_ids) == ["space-2"]
+    assert len(calls) == 2
+    # The refreshed listing is shared from now on.
+    AnytypeLoader(space_names=["Work"], **kwargs)
+    assert len(calls) == 2
+
+
 def test_extract_properties_normalizes_and_filters_keys():
     properties = [
         {"key": "tag", "multi_select": [{"name": "alpha"}, {"name": "beta"}]},
@@ -84,35 +156,175 @@ def test_extract_properties_normalizes_and_filters_keys():
 
 def test_parse_objects_response_reads_ids():
     payload = _load_fixture("spaces/space_1.json")
-    ids, has_more = AnytypeLoader._parse_objects_response(payload)
-    assert len(ids) == 10
-    assert ids[0] == "obj-1"
-    assert ids[-1] == "obj-10"
+    rows, has_more = AnytypeLoader._parse_objects_response(payload)
+    assert len(rows) == 10
+    assert rows[0] == ("obj-1", False)
+    assert rows[-1] == ("obj-10", False)
     assert has_more is False
 
 
-def test_iter_object_ids_follows_pagination(monkeypatch):
+def test_parse_objects_response_skips_rows_without_id():
+    payload = {"data": [{"id": "obj-1"}, {"name": "no id"}, None], "pagination": {}}
+
+    with pytest.warns(UserWarning, match="without an id"):
+        rows, has_more = AnytypeLoader._parse_objects_response(payload)
+
+    assert rows == [("obj-1", False)]
+    assert has_more is False
+
+
+def test_decode_objects_page_matches_dict_parser(monkeypatch):
+    # Without msgspec both sides would run the dict parser.
+    pytest.importorskip("msgspec")
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    payload = _load_fixture("spaces/space_1.json")
+    payload["pagination"]["has_more"] = True
+    payload["pagination"]["next_cursor"] = "c-1"
+    payload["data"][1]["archived"] = True
+
+    rows, has_more, cursor = loader._decode_objects_page(_DummyResponse(payload))
+
+    assert (rows, has_more) == AnytypeLoader._parse_objects_response(payload)
+    assert cursor == "c-1"
+    assert rows[1] == ("obj-2", True)
+
+
+def test_decode_object_response_matches_dict_parser(monkeypatch):
+    # Without msgspec both sides would run the dict parser.
+    pytest.importorskip("msgspec")
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Personal"}]
+    )
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    payload = _load_fixture("objects/obj-1.json")
+
+    markdown, meta = loader._decode_object_response("space-test", "obj-1", _DummyResponse(payload))
+    expected_markdown, expected_meta = loader._parse_object_response("space-test", "obj-1", payload)
+
+    assert markdown == expected_markdown
+    assert meta.as_dict() == expected_meta.as_dict()
+
+
+def test_aiter_object_ids_follows_pagination(monkeypatch):
     monkeypatch.setattr(
         AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
     )
     pages = [
-        (["obj-1", "obj-2"], True),
-        (["obj-3"], False),
+        (_rows("obj-1", "obj-2"), True, None),
+        (_rows("obj-3"), False, None),
     ]
     calls = []
 
-    def fake_list_objects(self, space_id, limit, offset):
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
         calls.append((space_id, limit, offset))
         return pages.pop(0)
 
-    monkeypatch.setattr(AnytypeLoader, "_list_objects", fake_list_objects)
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
 
-    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
-    loader.space_ids = ["space-1"]
+    loader = AnytypeLoader(
+        url="http://example.com",
+        api_key="key",
+        space_names=["Personal"],
+        page_size=2,
+        prefetch_pages=1,
+    )
+
+    async def collect():
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
 
-    result = list(loader._iter_object_ids("space-1"))
+    result = asyncio.run(collect())
     assert result == ["obj-1", "obj-2", "obj-3"]
-    assert calls == [("space-1", loader.page_size, 0), ("space-1", loader.page_size, 2)]
+    assert calls == [("space-1", 2, 0), ("space-1", 2, 2)]
+
+
+def test_aiter_object_ids_skips_archived_objects(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    pages = {
+        0: ([("obj-1", False), ("obj-2", True)], True, None),
+        2: ([("obj-3", False)], False, None),
+    }
+    calls = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        calls.append(offset)
+        return pages[offset]
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+
+    async def collect(loader):
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
+
+    kwargs = {"url": "http://example.com", "api_key": "key", "space_names": ["Personal"]}
+    loader = AnytypeLoader(page_size=2, prefetch_pages=1, **kwargs)
+    assert asyncio.run(collect(loader)) == ["obj-1", "obj-3"]
+    # Archived rows still count towards the next page's offset.
+    assert calls == [0, 2]
+
+    loader = AnytypeLoader(page_size=2, prefetch_pages=1, include_archived=True, **kwargs)
+    assert asyncio.run(collect(loader)) == ["obj-1", "obj-2", "obj-3"]
+
+
+def test_aiter_object_ids_follows_cursor(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    pages = {
+        None: (_rows("obj-1", "obj-2"), True, "c-1"),
+        "c-1": (_rows("obj-3", "obj-4"), True, "c-2"),
+        "c-2": (_rows("obj-5"), False, None),
+    }
+    calls = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        calls.append(cursor)
+        return pages[cursor]
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+
+    loader = AnytypeLoader(
+        url="http://example.com", api_key="key", space_names=["Personal"], page_size=2
+    )
+
+    async def collect():
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
+
+    result = asyncio.run(collect())
+    assert result == ["obj-1", "obj-2", "obj-3", "obj-4", "obj-5"]
+    assert loader._use_cursor is True
+    assert [c for c in calls if c is not None] == ["c-1", "c-2"]
+
+
+def test_aiter_object_ids_falls_back_to_offsets_after_cursor(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    ids = list("abcdefg")
+    calls = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        # Only the first page hands out a cursor.
+        calls.append((offset, cursor))
+        rows = ids[offset : offset + limit]
+        more = offset + limit < len(ids)
+        return _rows(*rows), more, "c1" if offset == 0 and more else None
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+
+    loader = AnytypeLoader(
+        url="http://example.com", api_key="key", space_names=["Personal"], page_size=2
+    )
+
+    async def collect():
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
+
+    assert asyncio.run(collect()) == ids
+    # Offset paging picks up after the cursor page instead of repeating it.
+    assert calls[calls.index((2, "c1")) + 1 :] == [(4, None), (6, None)]
 
 
 def test_fetch_object_returns_markdown_and_metadata(monkeypatch):
@@ -121,10 +333,10 @@ def test_fetch_object_returns_markdown_and_metadata(monkeypatch):
     )
     payload = _load_fixture("objects/obj-1.json")
 
-    def fake_request(self, method, url, **kwargs):
+    async def fake_request(self, method, url, **kwargs):
         return _DummyResponse(payload)
 
-    monkeypatch.setattr(AnytypeLoader, "_request_with_retries", fake_request)
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
 
     loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
     loader.space_name_map = {"space-test": "Personal"}
@@ -146,4 +358,581 @@ def test_fetch_object_returns_markdown_and_metadata(monkeypatch):
         "tags": ["alpha"],
         "description": "Desc 1",
     }
-    assert meta == expected_meta
+    assert meta.as_dict() == expected_meta
+
+
+def test_fetch_object_is_cached_until_cleared(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Personal"}]
+    )
+    payload = _load_fixture("objects/obj-1.json")
+    calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        calls.append(url)
+        return _DummyResponse(payload)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+
+    loader = AnytypeLoader(
+        url="http://example.com", api_key="key", space_names=["Personal"], revalidate=False
+    )
+    first = loader._fetch_object("space-test", "obj-1")
+    assert loader._fetch_object("space-test", "obj-1") is first
+    assert len(calls) == 1
+
+    loader.clear_cache()
+    loader._fetch_object("space-test", "obj-1")
+    assert len(calls) == 2
+
+
+def test_fetch_object_revalidates_cached_entry_with_etag(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Personal"}]
+    )
+    payload = _load_fixture("objects/obj-1.json")
+    responses = [
+        _DummyResponse(payload, headers={"ETag": '"v1"'}),
+        _DummyResponse(None, status_code=304),
+    ]
+    sent_headers = []
+
+    async def fake_request(self, method, url, **kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+
+    loader = AnytypeLoader(
+        url="http://example.com",
+        api_key="key",
+        space_names=["Personal"],
+        object_cache_size=10_000,
+    )
+    first = loader._fetch_object("space-test", "obj-1")
+    second = loader._fetch_object("space-test", "obj-1")
+
+    assert second is first
+    assert sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert loader._object_etags.maxsize == 10_000
+    # Revalidated objects are never served from the TTL cache, so it stays empty.
+    assert not loader._object_cache
+
+
+def test_aiter_object_ids_prefetches_pages(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    pages = {
+        0: (_rows("obj-1", "obj-2"), True, None),
+        2: (_rows("obj-3", "obj-4"), True, None),
+        4: (_rows("obj-5"), False, None),
+    }
+    calls = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        calls.append(offset)
+        return pages.get(offset, ([], False, None))
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+
+    loader = AnytypeLoader(
+        url="http://example.com",
+        api_key="key",
+        space_names=["Personal"],
+        page_size=2,
+        prefetch_pages=3,
+    )
+
+    async def collect():
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
+
+    result = asyncio.run(collect())
+    assert result == ["obj-1", "obj-2", "obj-3", "obj-4", "obj-5"]
+    # Pages are requested ahead of consumption rather than one round trip at a time.
+    assert calls[:3] == [0, 2, 4]
+
+
+def test_aiter_object_ids_follows_capped_page_size(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    ids = [f"obj-{i}" for i in range(30)]
+    calls = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        # The server never returns more than three rows per page.
+        calls.append(offset)
+        rows = ids[offset : offset + min(limit, 3)]
+        return _rows(*rows), offset + len(rows) < len(ids), None
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+
+    loader = AnytypeLoader(
+        url="http://example.com",
+        api_key="key",
+        space_names=["Personal"],
+        page_size=5,
+        prefetch_pages=3,
+    )
+
+    async def collect():
+        return [oid async for oid in loader._aiter_object_ids("space-1")]
+
+    assert asyncio.run(collect()) == ids
+    # Only the first window of speculative offsets is wasted.
+    assert len(calls) <= 15
+
+
+def test_list_objects_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    payload = _load_fixture("spaces/space_1.json")
+    responses = [
+        _DummyResponse(payload, headers={"ETag": '"v1"'}),
+        _DummyResponse({}, status_code=304),
+    ]
+    sent_headers = []
+
+    async def fake_request(self, method, url, **kwargs):
+        sent_headers.append(kwargs.get("headers"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+
+    first = loader._list_objects("space-1", limit=10, offset=0)
+    second = loader._list_objects("space-1", limit=10, offset=0)
+
+    assert sent_headers == [{}, {"If-None-Match": '"v1"'}]
+    assert second == first
+    assert len(first[0]) == 10
+
+
+def test_list_objects_cache_persists_in_cache_dir(monkeypatch, tmp_path):
+    pytest.importorskip("diskcache")
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    payload = _load_fixture("spaces/space_1.json")
+    responses = [
+        _DummyResponse(payload, headers={"ETag": '"v1"'}),
+        _DummyResponse({}, status_code=304),
+    ]
+
+    async def fake_request(self, method, url, **kwargs):
+        return responses.pop(0)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+
+    kwargs = {"url": "http://example.com", "api_key": "key", "space_names": ["Personal"]}
+    with AnytypeLoader(cache_dir=str(tmp_path), **kwargs) as loader:
+        first = loader._list_objects("space-1", limit=10, offset=0)
+    with AnytypeLoader(cache_dir=str(tmp_path), **kwargs) as loader:
+        second = loader._list_objects("space-1", limit=10, offset=0)
+
+    assert second == first
+
+
+def test_fetch_object_cache_persists_in_cache_dir(monkeypatch, tmp_path):
+    pytest.importorskip("diskcache")
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Personal"}]
+    )
+    payload = _load_fixture("objects/obj-1.json")
+    calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        calls.append(kwargs.get("headers"))
+        if calls[-1]:
+            return _DummyResponse(None, status_code=304)
+        return _DummyResponse(payload, headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+    kwargs = {
+        "url": "http://example.com",
+        "api_key": "key",
+        "space_names": ["Personal"],
+        "cache_dir": str(tmp_path),
+    }
+
+    with AnytypeLoader(**kwargs) as loader:
+        markdown, _ = loader._fetch_object("space-test", "obj-1")
+
+    with AnytypeLoader(revalidate=False, **kwargs) as loader:
+        cached_markdown, meta = loader._fetch_object("space-test", "obj-1")
+
+    assert len(calls) == 1
+    assert cached_markdown == markdown
+    assert meta.object_id == "obj-1"
+    assert meta.space_name == "Personal"
+
+    with AnytypeLoader(**kwargs) as loader:
+        revalidated_markdown, _ = loader._fetch_object("space-test", "obj-1")
+
+    assert calls[1] == {"If-None-Match": '"v1"'}
+    assert revalidated_markdown == markdown
+
+
+def test_fetch_object_ignores_unreadable_cache_dir_entries(monkeypatch, tmp_path):
+    diskcache = pytest.importorskip("diskcache")
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Renamed"}]
+    )
+    payload = _load_fixture("objects/obj-1.json")
+    calls = []
+
+    async def fake_request(self, method, url, **kwargs):
+        calls.append(kwargs.get("headers"))
+        return _DummyResponse(payload, headers={"ETag": '"v2"'})
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_with_retries", fake_request)
+    key = ("http://example.com", "object", "space-test", "obj-1")
+    with diskcache.Cache(str(tmp_path)) as cache:
+        # An entry in an older layout, holding a pickled metadata object.
+        cache.set(key, (0.0, '"v1"', ("# stale", object())))
+
+    kwargs = {
+        "url": "http://example.com",
+        "api_key": "key",
+        "space_names": ["Renamed"],
+        "cache_dir": str(tmp_path),
+        "revalidate": False,
+    }
+    with AnytypeLoader(**kwargs) as loader:
+        markdown, meta = loader._fetch_object("space-test", "obj-1")
+
+    assert calls == [{}]
+    assert markdown != "# stale"
+    assert meta.space_name == "Renamed"
+
+
+def test_alazy_load_fetches_with_bounded_workers(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    object_ids = [f"obj-{i}" for i in range(25)]
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        page = _rows(*object_ids[offset : offset + limit])
+        return page, offset + limit < len(object_ids), None
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_afetch_object(self, space_id, object_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        meta = _ObjectMeta(space_id, "Personal", object_id, object_id, False, "Page", {})
+        return f"# {object_id}", meta
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+    monkeypatch.setattr(AnytypeLoader, "_afetch_object", fake_afetch_object)
+    warmed = []
+
+    async def fake_awarm_up(self):
+        warmed.append(True)
+
+    monkeypatch.setattr(AnytypeLoader, "_awarm_up", fake_awarm_up)
+
+    loader = AnytypeLoader(
+        url="http://example.com",
+        api_key="key",
+        space_names=["Personal"],
+        page_size=10,
+        max_concurrency=4,
+    )
+
+    docs = asyncio.run(loader.aload())
+
+    assert sorted(doc.metadata["id"] for doc in docs) == sorted(object_ids)
+    assert peak <= 4
+    assert warmed == [True]
+
+
+def test_load_metadata_only_reads_listing_rows(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-test", "name": "Personal"}]
+    )
+    payload = _load_fixture("spaces/space_1.json")
+    calls = []
+
+    async def fake_request_page(self, space_id, limit, offset, cursor, headers=None):
+        calls.append(offset)
+        return _DummyResponse(payload)
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_objects_page", fake_request_page)
+
+    async def fail_afetch_object(self, space_id, object_id):
+        raise AssertionError("objects must not be fetched")
+
+    monkeypatch.setattr(AnytypeLoader, "_afetch_object", fail_afetch_object)
+
+    with AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"]) as loader:
+        metadata = loader.load_metadata_only()
+
+    assert calls[0] == 0
+    assert len(metadata) == 10
+    assert metadata[0] == {
+        "space_id": "space-test",
+        "space_name": "Personal",
+        "object_id": "obj-1",
+        "id": "obj-1",
+        "name": "Doc 1 - Availability",
+        "archived": False,
+        "type": "Page",
+        "tags": ["alpha"],
+    }
+
+
+def test_load_metadata_only_stops_on_empty_page(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    calls = []
+
+    async def fake_request_page(self, space_id, limit, offset, cursor, headers=None):
+        calls.append(offset)
+        return _DummyResponse({"data": [], "pagination": {"has_more": True}})
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_objects_page", fake_request_page)
+
+    with AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"]) as loader:
+        with pytest.warns(UserWarning, match="No objects returned"):
+            assert loader.load_metadata_only() == []
+
+    assert calls[0] == 0
+    assert len(calls) <= loader.prefetch_pages
+
+
+def test_lazy_load_runs_async_pipeline_on_private_loop(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    object_ids = [f"obj-{i}" for i in range(5)]
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        page = _rows(*object_ids[offset : offset + limit])
+        return page, offset + limit < len(object_ids), None
+
+    async def fake_afetch_object(self, space_id, object_id):
+        meta = _ObjectMeta(space_id, "Personal", object_id, object_id, False, "Page", {})
+        return f"# {object_id}", meta
+
+    async def fake_awarm_up(self):
+        pass
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+    monkeypatch.setattr(AnytypeLoader, "_afetch_object", fake_afetch_object)
+    monkeypatch.setattr(AnytypeLoader, "_awarm_up", fake_awarm_up)
+
+    with AnytypeLoader(
+        url="http://example.com", api_key="key", space_names=["Personal"], page_size=2
+    ) as loader:
+        docs = loader.load()
+        thread = loader._loop_runner._thread
+
+    assert sorted(doc.metadata["id"] for doc in docs) == object_ids
+    assert not thread.is_alive()
+    assert loader._loop_runner is None
+
+
+def test_close_shuts_down_open_lazy_load(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    object_ids = [f"obj-{i}" for i in range(20)]
+    cancelled = []
+
+    async def fake_alist_objects(self, space_id, limit, offset, cursor=None):
+        page = _rows(*object_ids[offset : offset + limit])
+        return page, offset + limit < len(object_ids), None
+
+    async def fake_afetch_object(self, space_id, object_id):
+        if object_id != "obj-0":
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(object_id)
+                raise
+        meta = _ObjectMeta(space_id, "Personal", object_id, object_id, False, "Page", {})
+        return f"# {object_id}", meta
+
+    async def fake_awarm_up(self):
+        pass
+
+    monkeypatch.setattr(AnytypeLoader, "_alist_objects", fake_alist_objects)
+    monkeypatch.setattr(AnytypeLoader, "_afetch_object", fake_afetch_object)
+    monkeypatch.setattr(AnytypeLoader, "_awarm_up", fake_awarm_up)
+    before = len(_loop_threads())
+
+    with AnytypeLoader(
+        url="http://example.com", api_key="key", space_names=["Personal"], max_concurrency=4
+    ) as loader:
+        documents = loader.lazy_load()
+        assert next(documents).metadata["id"] == "obj-0"
+
+    # Closing the loader cancelled the workers of the open iterator.
+    assert len(cancelled) == loader.max_concurrency
+    assert len(_loop_threads()) == before
+
+    # Closing the iterator afterwards does not start another loop.
+    documents.close()
+    assert loader._loop_runner is None
+    assert len(_loop_threads()) == before
+
+
+def _loop_threads() -> list:
+    return [t for t in threading.enumerate() if t.name == "anytype-loader"]
+
+
+def test_private_loop_is_not_kept_after_init_or_leaked(monkeypatch):
+    monkeypatch.setattr(AnytypeLoader, "_SPACES_CACHE", cachetools.TTLCache(maxsize=8, ttl=300))
+
+    async def fake_arequest_spaces(self):
+        return [{"id": "space-1", "name": "Personal"}]
+
+    monkeypatch.setattr(AnytypeLoader, "_arequest_spaces", fake_arequest_spaces)
+    before = len(_loop_threads())
+    kwargs = {"url": "http://example.com", "api_key": "key"}
+
+    # Resolving spaces does not leave a loop behind for async-only callers.
+    loader = AnytypeLoader(space_names=["Personal"], **kwargs)
+    assert loader._loop_runner is None
+    assert len(_loop_threads()) == before
+
+    # Nor does a constructor that fails.
+    loader.clear_cache()
+    with pytest.warns(UserWarning), pytest.raises(ValueError, match="resolve to an id"):
+        AnytypeLoader(space_names=["Missing"], **kwargs)
+    assert len(_loop_threads()) == before
+
+    # aclose() stops a loop started by sync calls.
+    loader._run(asyncio.sleep(0))
+    asyncio.run(loader.aclose())
+    assert loader._loop_runner is None
+    assert len(_loop_threads()) == before
+
+    # A loader dropped without close() stops its loop when collected.
+    loader._run(asyncio.sleep(0))
+    thread = loader._loop_runner._thread
+    del loader
+    gc.collect()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_parse_retry_after_accepts_http_dates():
+    parse = AnytypeLoader._parse_retry_after
+    assert parse(_DummyResponse({}, headers={"Retry-After": "3"})) == 3.0
+    for value in ("Wed, 21 Oct 2015 07:28:00 GMT", "Wed, 21 Oct 2015 07:28:00 -0000"):
+        assert parse(_DummyResponse({}, headers={"Retry-After": value})) == 0.0
+    assert parse(_DummyResponse({}, headers={"Retry-After": "soon"})) is None
+
+
+def test_request_with_retries_backs_off_on_transient_status(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    responses = [
+        _DummyResponse({}, status_code=503, headers={"Retry-After": "2"}),
+        _DummyResponse({}, status_code=502),
+        _DummyResponse({"ok": True}),
+    ]
+
+    async def fake_request(*args, **kwargs):
+        return responses.pop(0)
+
+    loader._async_client = _DummyClient(fake_request)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("anytype_loader.loader.asyncio.sleep", fake_sleep)
+
+    with pytest.warns(UserWarning, match="retrying"):
+        response = asyncio.run(loader._arequest_with_retries("get", "http://example.com/v1/spaces"))
+
+    assert response.payload == {"ok": True}
+    assert 2.0 <= sleeps[0] <= loader.retry_backoff * 3
+    assert loader.retry_backoff <= sleeps[1] <= sleeps[0] * 3
+
+
+def test_request_with_retries_jitters_first_delay(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    responses = []
+
+    async def fake_request(*args, **kwargs):
+        return responses.pop(0)
+
+    loader._async_client = _DummyClient(fake_request)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("anytype_loader.loader.asyncio.sleep", fake_sleep)
+
+    async def run():
+        for _ in range(20):
+            responses.extend([_DummyResponse({}, status_code=429), _DummyResponse({})])
+            await loader._arequest_with_retries("get", "http://example.com/v1/spaces")
+
+    with pytest.warns(UserWarning, match="retrying"):
+        asyncio.run(run())
+
+    # Workers rate limited together must not all retry after the same delay.
+    assert len(set(sleeps)) > 1
+    assert all(loader.retry_backoff <= s <= loader.retry_backoff * 3 for s in sleeps)
+
+
+def test_request_with_retries_does_not_retry_post_on_server_error(monkeypatch):
+    monkeypatch.setattr(
+        AnytypeLoader, "_list_spaces", lambda self: [{"id": "space-1", "name": "Personal"}]
+    )
+    loader = AnytypeLoader(url="http://example.com", api_key="key", space_names=["Personal"])
+    calls = []
+
+    async def fake_request(*args, **kwargs):
+        calls.append(args)
+        return _DummyResponse({"message": "boom"}, status_code=500)
+
+    loader._async_client = _DummyClient(fake_request)
+
+    with pytest.raises(AnytypeAPIError, match="boom"):
+        asyncio.run(
+            loader._arequest_with_retries("post", "http://example.com/v1/spaces/space-1/search")
+        )
+
+    assert len(calls) == 1
+
+
+def test_adaptive_limit_shrinks_on_rate_limit_and_grows_back():
+    async def run():
+        limit = _AdaptiveLimit(4, grow_after=2)
+        for _ in range(5):
+            limit.rate_limited()
+        assert limit.limit == 1
+
+        async with limit:
+            blocked = asyncio.create_task(limit.__aenter__())
+            await asyncio.sleep(0)
+            assert not blocked.done()
+        await blocked
+        await limit.__aexit__(None, None, None)
+
+        for _ in range(4):
+            limit.succeeded()
+        assert limit.limit == 3
+
+    asyncio.run(run())